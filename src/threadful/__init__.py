@@ -1,24 +1,81 @@
 """
 This file exposes the most important functions of this library.
+
+Only the core (@thread, ThreadWithReturn, join_all_*, shutdown) is imported eagerly.
+The other features are loaded on first use via __getattr__, to keep `import threadful` fast.
 """
 
-from .bonus import animate
+import typing
+
 from .core import (
+    ShutdownError,
+    ShutdownReport,
     ThreadWithReturn,
     join_all_or_raise,
     join_all_results,
     join_all_unwrap,
+    restart,
+    shutdown,
     thread,
 )
 
+if typing.TYPE_CHECKING:  # pragma: no cover
+    from .batch import Batch, submit_many
+    from .bonus import animate
+    from .pool import Task, WorkStealingPool
+    from .watchdog import Stall, Watchdog
+
 threadify = thread
 
+# attribute name -> submodule it's lazily imported from
+_LAZY = {
+    "Batch": "batch",
+    "submit_many": "batch",
+    "animate": "bonus",
+    "Task": "pool",
+    "WorkStealingPool": "pool",
+    "Stall": "watchdog",
+    "Watchdog": "watchdog",
+}
+
+
+def __getattr__(name: str) -> typing.Any:
+    """
+    Import optional features on first access.
+    """
+    if name in _LAZY:
+        # same as `from .<submodule> import <name>`
+        module = __import__(_LAZY[name], globals(), fromlist=[name], level=1)
+        value = getattr(module, name)
+        globals()[name] = value  # next access skips __getattr__
+        return value
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    """
+    Include the lazy attributes in dir(threadful).
+    """
+    return sorted({*globals(), *_LAZY})
+
+
 __all__ = [
+    "Batch",
+    "ShutdownError",
+    "ShutdownReport",
+    "Stall",
+    "Task",
     "ThreadWithReturn",
+    "Watchdog",
+    "WorkStealingPool",
     "animate",
     "join_all_or_raise",
     "join_all_results",
     "join_all_unwrap",
+    "restart",
+    "shutdown",
+    "submit_many",
     "thread",
     "threadify",
 ]
@@ -0,0 +1,169 @@
+"""
+Bulk submission of many small calls, without a thread (and Result) per call.
+"""
+
+import os
+import typing
+
+from result import Err, Ok, Result
+from typing_extensions import Self
+
+from .core import R, ThreadWithReturn
+
+_MISSING: typing.Any = object()  # slot of a call that hasn't finished (yet)
+
+
+def _run_chunk(
+    func: typing.Callable[..., R],
+    arg_tuples: list[tuple[typing.Any, ...]],
+    start: int,
+    stop: int,
+    values: list[R],
+    errors: dict[int, Exception],
+) -> None:
+    """
+    Run calls [start:stop] in the current thread and store their outcome in the shared result block.
+
+    Each chunk writes to its own slots, so no locking is needed.
+    """
+    for index in range(start, stop):
+        try:
+            values[index] = func(*arg_tuples[index])
+        except Exception as e:
+            errors[index] = e
+
+
+class Batch(typing.Generic[R]):
+    """
+    Should not be used directly.
+
+    Rather use submit_many(), which returns one handle for many calls of the same function.
+    The calls are split into contiguous chunks, each running in one thread;
+    return values are stored in a flat list and exceptions in a (sparse) dict, indexed by call.
+    Like @thread, nothing runs until you start() or ask for the results.
+    """
+
+    _values: list[R]
+    _errors: dict[int, Exception]
+    _chunks: list[tuple[int, int, ThreadWithReturn[None]]]
+
+    def __init__(
+        self,
+        func: typing.Callable[..., R],
+        arg_tuples: typing.Iterable[tuple[typing.Any, ...]],
+        workers: int | None = None,
+    ) -> None:
+        """
+        Prepare the result block and one thread per chunk.
+        """
+        args = list(arg_tuples)
+        size = len(args)
+        workers = max(min(workers or os.cpu_count() or 1, size), 1)
+        chunk_size = max(-(-size // workers), 1)  # ceil
+
+        self._values = [_MISSING] * size
+        self._errors = {}
+        self._chunks = []
+        for start in range(0, size, chunk_size):
+            stop = min(start + chunk_size, size)
+            chunk = ThreadWithReturn(target=_run_chunk, args=(func, args, start, stop, self._values, self._errors))
+            self._chunks.append((start, stop, chunk))
+
+    def __len__(self) -> int:
+        """
+        Number of calls in this batch.
+        """
+        return len(self._values)
+
+    def start(self) -> Self:
+        """
+        Start all chunks in the background. Duplicate starts are ignored.
+        """
+        for _, _, chunk in self._chunks:
+            chunk.start()
+        return self
+
+    def is_done(self) -> bool:
+        """
+        Returns whether all calls have finished (result or error).
+        """
+        self.start()
+        return all(chunk.is_done() for _, _, chunk in self._chunks)
+
+    def _collect(self, wait: bool = True) -> None:
+        """
+        Start all chunks and (optionally) block until they are done.
+
+        A chunk that failed as a whole (e.g. cancelled by shutdown()) stores its error for each of its calls.
+        """
+        self.start()
+        for start, stop, chunk in self._chunks:
+            match chunk.result(wait=wait):
+                case Err(exc) if exc is not None:
+                    for index in range(start, stop):
+                        self._errors.setdefault(index, exc)
+
+    def results(self, wait: bool = False) -> "tuple[Result[R, Exception | None], ...]":
+        """
+        Get a Result (Ok or Err) for every call, in order.
+
+        By default, calls that are not done yet return Err(None).
+        If `wait` is used, this blocks until every call is done.
+        """
+        self._collect(wait)
+
+        errors = self._errors
+        return tuple(
+            Err(errors.get(index)) if index in errors or value is _MISSING else Ok(value)
+            for index, value in enumerate(self._values)
+        )
+
+    def unwrap_all(self) -> tuple[R | None, ...]:
+        """
+        Wait for all calls and return their values, with None for calls that raised an exception.
+        """
+        self._collect()
+        if not self._errors:
+            return tuple(self._values)
+
+        errors = self._errors
+        return tuple(None if index in errors else value for index, value in enumerate(self._values))
+
+    def join(self) -> tuple[R, ...]:
+        """
+        Wait for all calls and return their values, or raise the exception of the first call that failed.
+        """
+        self._collect()
+        if self._errors:
+            raise self._errors[min(self._errors)]
+        return tuple(self._values)
+
+
+def submit_many(
+    func: typing.Callable[..., R],
+    arg_tuples: typing.Iterable[tuple[typing.Any, ...]],
+    workers: int | None = None,
+) -> Batch[R]:
+    """
+    Call `func(*args)` for every tuple in `arg_tuples`, spread over a few threads instead of one thread per call.
+
+    Useful for many tiny tasks, where creating a ThreadWithReturn per call would cost more than the work itself.
+
+    Examples:
+        batch = submit_many(lookup, [(key,) for key in keys])
+        batch.join()  # tuple of return values, raises if any call failed
+        batch.unwrap_all()  # tuple of return values, with None for failed calls
+        batch.results()  # tuple of Ok/Err
+
+    Args:
+        func: the function to call (not decorated with @thread).
+        arg_tuples: positional arguments for each call.
+        workers: max number of threads to use, defaults to the number of CPUs.
+
+    Returns:
+        Batch: a single handle for all calls.
+    """
+    return Batch(func, arg_tuples, workers=workers)
+
+
+__all__ = ["Batch", "submit_many"]
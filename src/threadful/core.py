@@ -5,14 +5,26 @@ Very simple threading abstraction.
 import contextlib
 import functools
 import threading
+import time
 import typing
+import weakref
 from copy import copy
 
-from result import Err, Ok, Result
-from typing_extensions import Self
+if typing.TYPE_CHECKING:  # pragma: no cover
+    # `result` (which imports `inspect`) and `typing_extensions` are slow to import,
+    # so they're only loaded when needed (see ThreadWithReturn.result)
+    from result import Result
+    from typing_extensions import Self
 
 P = typing.ParamSpec("P")
 R = typing.TypeVar("R")
+H = typing.TypeVar("H")  # any kind of handle (ThreadWithReturn, pool Task)
+
+
+class ShutdownError(RuntimeError):
+    """
+    Stored as the result of a handle that was cancelled because `shutdown()` was called before it started.
+    """
 
 
 class ThreadWithReturn(typing.Generic[R], threading.Thread):
@@ -29,6 +41,10 @@ class ThreadWithReturn(typing.Generic[R], threading.Thread):
     _return: R | Exception
     _callbacks: list[typing.Callable[[R], R]]
     _catch: list[typing.Callable[[Exception | R], Exception | R]]
+    _started: threading.Event  # from threading.Thread, shared between builder copies
+    _cancelled: bool = False
+    _started_at: float | None = None  # time.monotonic() when run() began, used by the watchdog
+    _waiting_on: "ThreadWithReturn[typing.Any] | None" = None  # handle this thread is currently joining
 
     def __init__(self, target: typing.Callable[P, R], *a: typing.Any, **kw: typing.Any) -> None:
         """
@@ -40,17 +56,48 @@ class ThreadWithReturn(typing.Generic[R], threading.Thread):
         super().__init__(*a, **kw)
         self._callbacks = []
         self._catch = []
+        _registry.track(self)
 
-    def start(self) -> Self:  # type: ignore
+    def start(self) -> "Self":  # type: ignore
         """
         Normally, starting multiple times will lead to an error.
 
         This version ignores duplicate starts.
+        After `shutdown()`, handles that were never started are cancelled instead
+        (unless they're started by a thread that shutdown() is still waiting for).
+        """
+        if self.ident is not None or self._cancelled:
+            # already running, done or cancelled: no need for the lock
+            return self
+
+        with _registry.lock:
+            if not _registry.accepting:
+                if not (_registry.draining and isinstance(threading.current_thread(), ThreadWithReturn)):
+                    self._cancel()
+                    return self
+
+                _registry.late.append(self)
+
+            # (re-)track, in case this handle was replaced by a builder copy
+            _registry._handles.add(self)
+            return self._launch()
+
+    def _launch(self) -> "Self":
+        """
+        Start the thread, ignoring duplicate starts (and cancelled handles).
         """
-        with contextlib.suppress(RuntimeError):
-            super().start()
+        if not self._cancelled:
+            with contextlib.suppress(RuntimeError):
+                super().start()
         return self
 
+    def _cancel(self) -> None:
+        """
+        Mark a handle that never started as cancelled, so it won't run and its result becomes an Err.
+        """
+        self._cancelled = True
+        self._return = ShutdownError("Thread was cancelled by shutdown() before it started.")
+
     def run(self) -> None:
         """
         Called in a new thread and handles the calling logic.
@@ -59,6 +106,11 @@ class ThreadWithReturn(typing.Generic[R], threading.Thread):
             return
 
         try:
+            if self._cancelled:
+                # a cancelled handle should never be launched, but don't run the target if it happens anyway
+                return
+
+            self._started_at = time.monotonic()
             result = self._target(*self._args, **self._kwargs)
             for callback in self._callbacks:
                 result = callback(result)
@@ -84,9 +136,11 @@ class ThreadWithReturn(typing.Generic[R], threading.Thread):
         If `wait` is used, this functions like a join() but with a Result.
 
         """
+        from result import Err, Ok
+
         self.start()
         if wait:
-            super().join()
+            self._wait()
 
         if self.is_alive():
             # still busy
@@ -105,7 +159,25 @@ class ThreadWithReturn(typing.Generic[R], threading.Thread):
         self.start()
         return not self.is_alive()
 
-    def then(self, callback: typing.Callable[[R], R]) -> Self:
+    def _wait(self, timeout: int | float | None = None) -> None:
+        """
+        Block until the thread is done, recording who is waiting on whom (for deadlock detection).
+        """
+        if self._cancelled:
+            return
+
+        current = threading.current_thread()
+        if not isinstance(current, ThreadWithReturn):
+            super().join(timeout)
+            return
+
+        current._waiting_on = self
+        try:
+            super().join(timeout)
+        finally:
+            current._waiting_on = None
+
+    def then(self, callback: typing.Callable[[R], R]) -> "Self":
         """
         Attach a callback (which runs in the thread as well) on success.
 
@@ -113,9 +185,10 @@ class ThreadWithReturn(typing.Generic[R], threading.Thread):
         """
         new = copy(self)
         new._callbacks.append(callback)
+        _registry.replace(self, new)
         return new  # builder pattern
 
-    def catch(self, callback: typing.Callable[[Exception | R], Exception | R]) -> Self:
+    def catch(self, callback: typing.Callable[[Exception | R], Exception | R]) -> "Self":
         """
         Attach a callback (which runs in the thread as well) on error.
 
@@ -124,22 +197,174 @@ class ThreadWithReturn(typing.Generic[R], threading.Thread):
         """
         new = copy(self)
         new._catch.append(callback)
+        _registry.replace(self, new)
         return new
 
     def join(self, timeout: int | float | None = None) -> R:  # type: ignore
         """
         Enhanced version of thread.join that also returns the value or raises the exception.
+
+        Raises TimeoutError if `timeout` passed before the thread finished.
         """
         self.start()
-        super().join(timeout)
+        self._wait(timeout)
+        if self.is_alive():
+            raise TimeoutError(f"{self.name} did not finish within {timeout} seconds.")
+
+        # thread must be ready here (or TimeoutError was raised), so no need for the Result wrapper
+        result = self._return
+        if isinstance(result, Exception):
+            raise result
+        return result
+
 
-        match self.result():
-            case Ok(value):
-                return value
-            case Err(exc):
-                raise exc or Exception("Something went wrong.")
+class ShutdownReport(typing.NamedTuple, typing.Generic[H]):
+    """
+    Outcome of `shutdown()`, grouping every tracked handle by what happened to it.
+
+    Attributes:
+        drained: handles that were running and finished before the deadline.
+        cancelled: handles that were never started and will now never run.
+        aborted: handles that finished, but with a ShutdownError (e.g. because work they depend on was cancelled).
+        unfinished: handles that were still running when shutdown() returned (deadline passed or wait=False).
+    """
 
-            # thread must be ready so Err(None) can't happen
+    drained: tuple[H, ...] = ()
+    cancelled: tuple[H, ...] = ()
+    aborted: tuple[H, ...] = ()
+    unfinished: tuple[H, ...] = ()
+
+    @property
+    def dropped(self) -> tuple[H, ...]:
+        """
+        All handles whose work was lost or not awaited: cancelled + aborted + unfinished.
+        """
+        return self.cancelled + self.aborted + self.unfinished
+
+
+class _Registry:
+    """
+    Weakly keeps track of every ThreadWithReturn, so they can be drained or cancelled on shutdown.
+
+    Handles are only referenced weakly: a handle you dropped (and that isn't running) is simply forgotten.
+    Running threads stay alive via `threading`'s own bookkeeping.
+    """
+
+    lock: threading.Lock
+    accepting: bool
+    draining: bool  # True while shutdown() waits, so running threads can still start nested work
+    late: list[ThreadWithReturn[typing.Any]]  # nested work started while draining
+    _handles: "weakref.WeakSet[ThreadWithReturn[typing.Any]]"
+
+    def __init__(self) -> None:
+        """
+        Start out accepting work with no handles.
+        """
+        self.lock = threading.Lock()
+        self.accepting = True
+        self.draining = False
+        self.late = []
+        self._handles = weakref.WeakSet()
+
+    def track(self, handle: ThreadWithReturn[typing.Any]) -> None:
+        """
+        Register a new handle.
+        """
+        with self.lock:
+            self._handles.add(handle)
+
+    def replace(self, old: ThreadWithReturn[typing.Any], new: ThreadWithReturn[typing.Any]) -> None:
+        """
+        Track a builder copy (.then/.catch) instead of the handle it was copied from, since they're the same task.
+        """
+        with self.lock:
+            self._handles.discard(old)
+            self._handles.add(new)
+
+    def handles(self) -> list[ThreadWithReturn[typing.Any]]:
+        """
+        Return all known handles.
+        """
+        with self.lock:
+            return list(self._handles)
+
+
+_registry = _Registry()
+
+
+def shutdown(
+    wait: bool = True, timeout: float | None = None, cancel_pending: bool = True
+) -> ShutdownReport[ThreadWithReturn[typing.Any]]:
+    """
+    Stop accepting work and drain in-flight threads, e.g. from a SIGTERM handler.
+
+    After calling this, starting a handle that never ran cancels it instead:
+        its result becomes Err(ShutdownError) and join() raises ShutdownError.
+    While waiting, running threads can still start (and join) new nested threads; these are drained too.
+    Call `restart()` to accept new work again.
+
+    Args:
+        wait: block until running threads are done (or `timeout` passes).
+        timeout: max total seconds to wait for all running threads together. None waits forever.
+        cancel_pending: cancel handles that were created but never started.
+            If False, they are started now and drained together with the running threads.
+
+    Returns:
+        ShutdownReport: which handles were drained, cancelled, aborted or are still unfinished.
+    """
+    running: list[ThreadWithReturn[typing.Any]] = []
+    cancelled: list[ThreadWithReturn[typing.Any]] = []
+
+    with _registry.lock:
+        _registry.accepting = False
+        _registry.draining = wait
+        for handle in list(_registry._handles):
+            if handle.ident is not None:
+                if handle.is_alive():
+                    running.append(handle)
+            elif handle._cancelled or handle._started.is_set():
+                # already reported by an earlier shutdown, or a builder copy of a handle that did start
+                continue
+            elif not cancel_pending and handle._launch().ident is not None:
+                running.append(handle)
+            else:
+                handle._cancel()
+                cancelled.append(handle)
+
+    if wait:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        pending = running
+        try:
+            while pending:
+                for handle in pending:
+                    remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+                    threading.Thread.join(handle, remaining)
+
+                with _registry.lock:
+                    pending = [_ for _ in _registry.late if _.ident is not None]
+                    _registry.late = []
+                running = running + pending
+        finally:
+            with _registry.lock:
+                _registry.draining = False
+
+    finished = [_ for _ in running if not _.is_alive()]
+    return ShutdownReport(
+        drained=tuple(_ for _ in finished if not isinstance(_._return, ShutdownError)),
+        cancelled=tuple(cancelled),
+        aborted=tuple(_ for _ in finished if isinstance(_._return, ShutdownError)),
+        unfinished=tuple(_ for _ in running if _.is_alive()),
+    )
+
+
+def restart() -> None:
+    """
+    Accept new work again after `shutdown()`.
+
+    Handles that were cancelled by the shutdown stay cancelled.
+    """
+    with _registry.lock:
+        _registry.accepting = True
 
 
 @typing.overload
@@ -213,7 +438,7 @@ def thread(
     return wraps
 
 
-def join_all_results(*threads: ThreadWithReturn[R]) -> tuple[Result[R, Exception], ...]:
+def join_all_results(*threads: ThreadWithReturn[R]) -> "tuple[Result[R, Exception], ...]":
     """
     Wait for all threads to complete and retrieve their results as `Result` objects.
 
@@ -256,4 +481,14 @@ def join_all_unwrap(*threads: ThreadWithReturn[R]) -> tuple[R | None, ...]:
     return tuple(_.result(wait=True).unwrap_or(None) for _ in threads)
 
 
-__all__ = ["ThreadWithReturn", "join_all_or_raise", "join_all_results", "join_all_unwrap", "thread"]
+__all__ = [
+    "ShutdownError",
+    "ShutdownReport",
+    "ThreadWithReturn",
+    "join_all_or_raise",
+    "join_all_results",
+    "join_all_unwrap",
+    "restart",
+    "shutdown",
+    "thread",
+]
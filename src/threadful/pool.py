@@ -0,0 +1,452 @@
+"""
+Work-stealing thread pool for nested (divide-and-conquer) workloads.
+
+Every worker has its own deque: work started from inside a worker is pushed to and popped from its local end (LIFO),
+while idle workers steal the oldest work from the other end of someone else's deque (FIFO).
+Work started from outside the pool goes into a shared FIFO queue.
+A join() from inside a worker runs other pending tasks while it waits, so nested fan-outs can't exhaust the pool.
+"""
+
+import collections
+import functools
+import itertools
+import os
+import threading
+import time
+import typing
+from copy import copy
+
+from result import Err, Ok, Result
+from typing_extensions import Self
+
+from .core import P, R, ShutdownError, ShutdownReport
+
+# how long a joining worker sleeps when there's nothing to help with, before checking for new work again
+_HELP_INTERVAL = 0.001
+
+
+class Task(typing.Generic[R]):
+    """
+    Should not be used directly.
+
+    Rather use the @pool.thread decorator or pool.submit().
+    Mirrors the ThreadWithReturn API: nothing is scheduled until you start(), join() or ask for a result().
+    """
+
+    _pool: "WorkStealingPool"
+    _target: typing.Callable[..., R]
+    _args: tuple[typing.Any, ...]
+    _kwargs: dict[str, typing.Any]
+    _return: R | Exception
+    _callbacks: list[typing.Callable[[R], R]]
+    _catch: list[typing.Callable[[Exception | R], Exception | R]]
+    _done: threading.Event
+    _starts: "itertools.count[int]"
+
+    def __init__(
+        self,
+        pool: "WorkStealingPool",
+        target: typing.Callable[..., R],
+        args: tuple[typing.Any, ...],
+        kwargs: dict[str, typing.Any],
+    ) -> None:
+        """
+        Store the call, without scheduling it yet.
+        """
+        self._pool = pool
+        self._target = target
+        self._args = args
+        self._kwargs = kwargs
+        self._callbacks = []
+        self._catch = []
+        self._done = threading.Event()
+        self._starts = itertools.count()
+
+    def start(self) -> Self:
+        """
+        Schedule the task on its pool. Duplicate starts are ignored.
+        """
+        if not self._done.is_set():
+            self._pool._submit(self)
+        return self
+
+    def _run(self) -> None:
+        """
+        Called by a worker and handles the calling logic, like ThreadWithReturn.run().
+        """
+        try:
+            result = self._target(*self._args, **self._kwargs)
+            for callback in self._callbacks:
+                result = callback(result)
+            self._return = result
+        except Exception as _e:
+            e: Exception | R = _e  # make mypy happy
+            for err_callback in self._catch:
+                e = err_callback(e)
+            self._return = e
+        finally:
+            self._callbacks.clear()
+            self._catch.clear()
+            del self._target, self._args, self._kwargs
+            self._done.set()
+
+    def _cancel(self) -> None:
+        """
+        Finish the task with a ShutdownError without running it.
+        """
+        self._return = ShutdownError("Task was cancelled by shutdown() before it started.")
+        self._done.set()
+
+    def result(self, wait: bool = False) -> "Result[R, Exception | None]":
+        """
+        Get the result value (Ok or Err) from the task.
+
+        By default, if the task is not ready, Err(None) is returned.
+        If `wait` is used, this functions like a join() but with a Result.
+        """
+        self.start()
+        if wait:
+            self._pool._wait(self)
+
+        if not self._done.is_set():
+            # still busy
+            return Err(None)
+
+        result = self._return
+        if isinstance(result, Exception):
+            return Err(result)
+        else:
+            return Ok(result)
+
+    def is_done(self) -> bool:
+        """
+        Returns whether the task has finished (result or error).
+        """
+        self.start()
+        return self._done.is_set()
+
+    def then(self, callback: typing.Callable[[R], R]) -> Self:
+        """
+        Attach a callback (which runs in the worker as well) on success.
+
+        Returns a new task, so you can do .then().then().then(); only start the last one.
+        """
+        new = self._copy()
+        new._callbacks.append(callback)
+        return new
+
+    def catch(self, callback: typing.Callable[[Exception | R], Exception | R]) -> Self:
+        """
+        Attach a callback (which runs in the worker as well) on error.
+
+        You can either return a new Exception or a fallback value.
+        Returns a new task, so you can do .then().catch().catch(); only start the last one.
+        """
+        new = self._copy()
+        new._catch.append(callback)
+        return new
+
+    def _copy(self) -> Self:
+        """
+        Copy for the builder methods, with its own callbacks and start/done state.
+        """
+        new = copy(self)
+        new._callbacks = list(self._callbacks)
+        new._catch = list(self._catch)
+        new._done = threading.Event()
+        new._starts = itertools.count()
+        return new
+
+    def join(self, timeout: int | float | None = None) -> R:
+        """
+        Wait for the task and return its value or raise its exception.
+
+        Inside a worker of the same pool, other pending tasks are executed while waiting (so this never deadlocks).
+        Raises TimeoutError if `timeout` passed before the task finished.
+        """
+        self.start()
+        if not self._pool._wait(self, timeout):
+            raise TimeoutError(f"Task did not finish within {timeout} seconds.")
+
+        match self.result():
+            case Ok(value):
+                return value
+            case Err(exc):
+                raise exc or Exception("Something went wrong.")
+
+
+class WorkStealingPool:
+    """
+    Thread pool with a deque per worker, for tasks that start and join nested tasks.
+
+    Examples:
+        pool = WorkStealingPool(workers=4)
+
+        @pool.thread
+        def tree_sum(node) -> int:
+            children = [tree_sum(child).start() for child in node.children]
+            return node.value + sum(child.join() for child in children)
+
+        tree_sum(root).join()
+        pool.shutdown()
+    """
+
+    workers: int
+
+    _injector: collections.deque[Task[typing.Any]]  # work from outside the pool
+    _deques: list[collections.deque[Task[typing.Any]]]  # work per worker
+    _threads: list[threading.Thread]
+    _local: threading.local  # .index of the current worker, only set in this pool's worker threads
+    _cond: threading.Condition  # only used to wake up idle workers and for shutdown()
+    _idle: int  # workers waiting on _cond
+    _tasks: set[Task[typing.Any]]  # submitted, not yet finished
+    _late: list[Task[typing.Any]]  # nested tasks submitted while shutdown() drains
+    _accepting: bool
+    _draining: bool
+    _closing: bool
+
+    def __init__(self, workers: int | None = None) -> None:
+        """
+        Start the worker threads.
+
+        Args:
+            workers: number of worker threads, defaults to the number of CPUs.
+        """
+        self.workers = workers or os.cpu_count() or 1
+
+        self._injector = collections.deque()
+        self._deques = [collections.deque() for _ in range(self.workers)]
+        self._local = threading.local()
+        self._cond = threading.Condition()
+        self._idle = 0
+        self._tasks = set()
+        self._late = []
+        self._accepting = True
+        self._draining = False
+        self._closing = False
+
+        self._threads = [
+            threading.Thread(target=self._work, args=(index,), name=f"threadful-pool-{index}", daemon=True)
+            for index in range(self.workers)
+        ]
+        for worker in self._threads:
+            worker.start()
+
+    def thread(self, my_function: typing.Callable[P, R]) -> typing.Callable[P, Task[R]]:
+        """
+        Like @thread, but calls return a Task that runs on this pool.
+        """
+
+        @functools.wraps(my_function)
+        def wraps(*a: P.args, **kw: P.kwargs) -> Task[R]:
+            return Task(self, my_function, a, kw)
+
+        return wraps
+
+    def submit(self, my_function: typing.Callable[P, R], *a: P.args, **kw: P.kwargs) -> Task[R]:
+        """
+        Schedule a single call right away.
+        """
+        return Task(self, my_function, a, kw).start()
+
+    def _worker_index(self) -> int | None:
+        """
+        Index of the current thread if it's one of this pool's workers.
+        """
+        return typing.cast(int | None, getattr(self._local, "index", None))
+
+    def _allowed(self, index: int | None) -> bool:
+        """
+        Whether new work may be submitted: always, unless shutting down.
+
+        While shutdown() drains, tasks that are still running may start nested work.
+        """
+        return self._accepting or (self._draining and index is not None)
+
+    def _has_work(self) -> bool:
+        """
+        Whether any deque has a task waiting.
+        """
+        return bool(self._injector) or any(self._deques)
+
+    def _submit(self, task: Task[typing.Any]) -> None:
+        """
+        Push a task to the local deque (inside a worker) or the shared queue (outside).
+
+        Deque operations are atomic, so the lock is only needed to wake up idle workers (or while shutting down).
+        """
+        if next(task._starts):
+            # itertools.count is atomic: only the first start() schedules the task
+            return
+
+        index = self._worker_index()
+        if not self._accepting:
+            with self._cond:
+                if not self._allowed(index):
+                    task._cancel()
+                    return
+                self._late.append(task)
+
+        queue = self._injector if index is None else self._deques[index]
+        self._tasks.add(task)
+        queue.append(task)
+
+        if not self._allowed(index):
+            # shutdown() started while we were submitting; take the task back unless a worker already has it
+            try:
+                queue.remove(task)
+            except ValueError:  # pragma: no cover
+                return
+            self._tasks.discard(task)
+            task._cancel()
+            return
+
+        if self._idle:
+            with self._cond:
+                self._cond.notify()
+
+    def _find(self, index: int) -> Task[typing.Any] | None:
+        """
+        Take the next task for a worker: newest local work first, then the shared queue, then steal the oldest.
+        """
+        try:
+            return self._deques[index].pop()
+        except IndexError:
+            pass
+
+        try:
+            return self._injector.popleft()
+        except IndexError:
+            pass
+
+        for offset in range(1, self.workers):
+            try:
+                return self._deques[(index + offset) % self.workers].popleft()
+            except IndexError:
+                continue
+        return None
+
+    def _execute(self, task: Task[typing.Any]) -> None:
+        """
+        Run a task and forget about it.
+        """
+        try:
+            task._run()
+        finally:
+            self._tasks.discard(task)
+
+    def _work(self, index: int) -> None:
+        """
+        Worker loop: run tasks until the pool is shut down and no work is left.
+        """
+        self._local.index = index
+        while True:
+            task = self._find(index)
+            if task is not None:
+                self._execute(task)
+                continue
+
+            with self._cond:
+                # _submit checks _idle after pushing, so either it sees us here or we see its task below
+                self._idle += 1
+                try:
+                    while not self._has_work() and not self._closing:
+                        self._cond.wait()
+                finally:
+                    self._idle -= 1
+
+                if self._closing and not self._has_work():
+                    return
+
+    def _wait(self, task: Task[typing.Any], timeout: float | None = None) -> bool:
+        """
+        Wait until `task` is done, helping with other work if called from inside a worker.
+
+        Returns whether the task is done.
+        """
+        index = self._worker_index()
+        if index is None:
+            return task._done.wait(timeout)
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while not task._done.is_set():
+            if deadline is not None and time.monotonic() >= deadline:
+                return False
+
+            other = self._find(index)
+            if other is not None:
+                self._execute(other)
+            else:
+                # `task` is running on another worker and there's nothing to help with (yet)
+                task._done.wait(_HELP_INTERVAL)
+        return True
+
+    def shutdown(
+        self, wait: bool = True, timeout: float | None = None, cancel_pending: bool = True
+    ) -> ShutdownReport[Task[typing.Any]]:
+        """
+        Stop accepting work, drain running tasks and stop the workers.
+
+        Same semantics as threadful.shutdown(), but only for this pool.
+
+        Args:
+            wait: block until the workers are done (or `timeout` passes).
+            timeout: max total seconds to wait for all workers together. None waits forever.
+            cancel_pending: cancel tasks that are queued but not running yet.
+                If False, the workers finish all queued work first.
+
+        Returns:
+            ShutdownReport: which tasks were drained, cancelled, aborted or are still unfinished.
+        """
+        cancelled: list[Task[typing.Any]] = []
+        with self._cond:
+            self._accepting = False
+            self._draining = wait
+            self._closing = True
+            if cancel_pending:
+                for queue in (self._injector, *self._deques):
+                    while True:
+                        try:
+                            cancelled.append(queue.popleft())
+                        except IndexError:
+                            break
+            tasks = [_ for _ in self._tasks if _ not in cancelled]
+            self._cond.notify_all()
+
+        for task in cancelled:
+            task._cancel()
+            self._tasks.discard(task)
+
+        if wait:
+            deadline = None if timeout is None else time.monotonic() + timeout
+            try:
+                for worker in self._threads:
+                    worker.join(None if deadline is None else max(deadline - time.monotonic(), 0))
+            finally:
+                with self._cond:
+                    self._draining = False
+                    tasks += self._late
+                    self._late = []
+
+        finished = [_ for _ in tasks if _._done.is_set()]
+        return ShutdownReport(
+            drained=tuple(_ for _ in finished if not isinstance(_._return, ShutdownError)),
+            cancelled=tuple(cancelled),
+            aborted=tuple(_ for _ in finished if isinstance(_._return, ShutdownError)),
+            unfinished=tuple(_ for _ in tasks if not _._done.is_set()),
+        )
+
+    def __enter__(self) -> Self:
+        """
+        Use the pool for the duration of a `with` block.
+        """
+        return self
+
+    def __exit__(self, *_: typing.Any) -> None:
+        """
+        Finish all queued work and stop the workers at the end of a `with` block.
+        """
+        self.shutdown(cancel_pending=False)
+
+
+__all__ = ["Task", "WorkStealingPool"]
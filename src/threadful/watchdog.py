@@ -0,0 +1,217 @@
+"""
+Optional watchdog that reports threaded tasks which are stalled or deadlocked.
+
+Nothing is sampled unless a Watchdog is started, and even then only once every `interval` seconds.
+"""
+
+import sys
+import threading
+import time
+import traceback
+import typing
+import weakref
+
+from typing_extensions import Self
+
+from .core import ThreadWithReturn, _registry
+
+
+class Stall(typing.NamedTuple):
+    """
+    A running handle that exceeded the watchdog threshold or is part of a join() cycle.
+
+    Attributes:
+        handle: the stalled thread.
+        elapsed: seconds since the thread started running its target.
+        stack: where the thread currently is (most recent call last).
+        waiting_on: the handle this thread is currently join()ing, if any.
+        deadlock: True if following `waiting_on` leads back to this handle, so it can never finish.
+    """
+
+    handle: ThreadWithReturn[typing.Any]
+    elapsed: float
+    stack: traceback.StackSummary
+    waiting_on: ThreadWithReturn[typing.Any] | None = None
+    deadlock: bool = False
+
+    def format(self) -> str:
+        """
+        Human-readable description including the stack, similar to a traceback.
+        """
+        reason = "deadlocked" if self.deadlock else f"running for {self.elapsed:.1f}s"
+        header = f"{self.handle.name} is {reason}"
+        if self.waiting_on is not None:
+            header += f" (waiting on {self.waiting_on.name})"
+        return header + ":\n" + "".join(self.stack.format())
+
+
+def print_stall(stall: Stall) -> None:
+    """
+    Default watchdog hook: print the stall to stderr.
+    """
+    print(stall.format(), file=sys.stderr, flush=True)
+
+
+def _is_deadlocked(handle: ThreadWithReturn[typing.Any]) -> bool:
+    """
+    Follow the chain of join()s starting at `handle` and check whether it loops back.
+    """
+    seen = {handle}
+    current = handle._waiting_on
+    while current is not None:
+        if current is handle:
+            return True
+        if current in seen:
+            # a cycle further down the chain, which will be reported for its own members.
+            return False
+        seen.add(current)
+        current = current._waiting_on
+    return False
+
+
+class Watchdog:
+    """
+    Periodically checks running ThreadWithReturn handles and reports stalls via a hook.
+
+    Each stalled handle is reported once for being slow, and once more if it later becomes deadlocked.
+
+    Examples:
+        with Watchdog(threshold=30):
+            ...
+
+        dog = Watchdog(threshold=5, interval=1, hook=my_logger).start()
+        ...
+        dog.stop()
+    """
+
+    threshold: float
+    interval: float
+    hook: typing.Callable[[Stall], typing.Any]
+    limit: int | None
+
+    _reported_slow: "weakref.WeakSet[ThreadWithReturn[typing.Any]]"
+    _reported_deadlock: "weakref.WeakSet[ThreadWithReturn[typing.Any]]"
+    _stop: threading.Event
+    _thread: threading.Thread | None
+
+    def __init__(
+        self,
+        threshold: float = 30.0,
+        interval: float = 1.0,
+        hook: typing.Callable[[Stall], typing.Any] = print_stall,
+        limit: int | None = 20,
+    ) -> None:
+        """
+        Configure the watchdog, without starting it yet.
+
+        Args:
+            threshold: seconds a handle may run before it's reported as stalled.
+            interval: seconds between two samples; this bounds the overhead of the watchdog.
+            hook: called with a Stall for every newly stalled handle (in the watchdog thread).
+                Exceptions raised by the hook are printed to stderr; the handle is then reported again next sample.
+            limit: max number of stack frames to capture per stall (None for all).
+        """
+        self.threshold = threshold
+        self.interval = interval
+        self.hook = hook
+        self.limit = limit
+
+        self._reported_slow = weakref.WeakSet()
+        self._reported_deadlock = weakref.WeakSet()
+        self._stop = threading.Event()
+        self._thread = None
+
+    def check(self) -> list[Stall]:
+        """
+        Take a single sample: report and return newly stalled handles.
+
+        This is what the watchdog thread runs every `interval`, but it can also be called manually.
+        """
+        now = time.monotonic()
+        candidates = []
+        for handle in _registry.handles():
+            if handle._started_at is None or handle in self._reported_deadlock or not handle.is_alive():
+                continue
+
+            elapsed = now - handle._started_at
+            deadlock = handle._waiting_on is not None and _is_deadlocked(handle)
+            if deadlock or (elapsed >= self.threshold and handle not in self._reported_slow):
+                candidates.append((handle, elapsed, deadlock))
+
+        if not candidates:
+            # don't pay for sys._current_frames() if nothing is stalled
+            return []
+
+        frames = sys._current_frames()
+        stalls = []
+        for handle, elapsed, deadlock in candidates:
+            frame = frames.get(handle.ident or -1)
+            if frame is None:  # pragma: no cover
+                # finished in the meantime
+                continue
+
+            stack = traceback.StackSummary.extract(traceback.walk_stack(frame), limit=self.limit)
+            stack.reverse()
+            stall = Stall(handle, elapsed, stack, waiting_on=handle._waiting_on, deadlock=deadlock)
+            try:
+                self.hook(stall)
+            except Exception:
+                # a broken hook should not kill the watchdog thread
+                print(f"Exception in watchdog hook {self.hook!r}:", file=sys.stderr)
+                traceback.print_exc(file=sys.stderr)
+                continue
+
+            self._reported_slow.add(handle)
+            if deadlock:
+                self._reported_deadlock.add(handle)
+            stalls.append(stall)
+
+        return stalls
+
+    def _run(self, stop: threading.Event) -> None:
+        """
+        Sample every `interval` seconds until stopped.
+
+        Each run gets its own `stop` event, so a restart can't revive a thread that was stopped from the hook.
+        """
+        while not stop.wait(self.interval):
+            self.check()
+
+    def start(self) -> Self:
+        """
+        Start sampling in a background (daemon) thread.
+        """
+        if self._thread is None:
+            self._stop = threading.Event()
+            self._thread = threading.Thread(
+                target=self._run, args=(self._stop,), name="threadful-watchdog", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        """
+        Stop the background thread (if running).
+
+        Can also be called from within the hook, in which case the thread stops after the current sample.
+        """
+        if self._thread is not None:
+            self._stop.set()
+            if self._thread is not threading.current_thread():
+                self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> Self:
+        """
+        Start the watchdog for the duration of a `with` block.
+        """
+        return self.start()
+
+    def __exit__(self, *_: typing.Any) -> None:
+        """
+        Stop the watchdog at the end of a `with` block.
+        """
+        self.stop()
+
+
+__all__ = ["Stall", "Watchdog", "print_stall"]
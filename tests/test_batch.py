@@ -0,0 +1,64 @@
+import threading
+
+import pytest
+
+from threadful import ShutdownError, restart, shutdown, submit_many
+
+
+@pytest.fixture(autouse=True)
+def accept_work():
+    restart()
+    yield
+    restart()
+
+
+def check(value: int) -> int:
+    if value < 0:
+        raise ValueError(value)
+    return value * 2
+
+
+def test_submit_many():
+    batch = submit_many(check, [(value,) for value in range(100)], workers=4)
+
+    assert len(batch) == 100
+    assert batch.join() == tuple(value * 2 for value in range(100))
+    assert batch.is_done()
+    assert batch.unwrap_all() == batch.join()
+    assert all(result.is_ok() for result in batch.results())
+
+
+def test_submit_many_errors():
+    batch = submit_many(check, [(1,), (-1,), (2,), (-2,)], workers=2)
+
+    assert batch.unwrap_all() == (2, None, 4, None)
+
+    results = batch.results(wait=True)
+    assert results[0].unwrap() == 2
+    assert isinstance(results[1].unwrap_err(), ValueError)
+
+    with pytest.raises(ValueError, match="-1"):
+        batch.join()  # the first failing call
+
+
+def test_submit_many_not_done():
+    release = threading.Event()
+    batch = submit_many(release.wait, [()])
+
+    assert not batch.is_done()
+    assert batch.results()[0].unwrap_err() is None
+
+    release.set()
+    assert batch.join() == (True,)
+
+
+def test_submit_many_empty():
+    assert submit_many(check, []).join() == ()
+
+
+def test_submit_many_shutdown():
+    batch = submit_many(check, [(1,), (2,)])
+    shutdown()
+
+    assert batch.unwrap_all() == (None, None)
+    assert all(isinstance(result.unwrap_err(), ShutdownError) for result in batch.results())
@@ -0,0 +1,69 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import threadful
+
+SRC = Path(__file__).parent.parent / "src"
+
+# heavy (optional) modules that a bare `import threadful` should not load
+LAZY_MODULES = {
+    "threadful.batch",
+    "threadful.bonus",
+    "threadful.pool",
+    "threadful.watchdog",
+    "result",
+    "typing_extensions",
+    "inspect",
+    "traceback",
+}
+
+
+def import_times(code: str) -> dict[str, int]:
+    """
+    Run `code` in a fresh interpreter with -X importtime and return {module: cumulative microseconds}.
+    """
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+
+    times = {}
+    for line in output.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def test_import_is_lazy():
+    times = import_times("import threadful")
+
+    assert "threadful.core" in times
+    assert not LAZY_MODULES & set(times)
+    print(f"import threadful: {times['threadful'] / 1000:.1f}ms")
+
+
+def test_lazy_attributes_load_on_access():
+    times = import_times("import threadful; threadful.animate; threadful.Watchdog")
+
+    assert {"threadful.bonus", "threadful.watchdog"} <= set(times)
+    assert "threadful.pool" not in times
+
+
+def test_lazy_attributes():
+    assert threadful.animate is threadful.bonus.animate
+    assert set(threadful.__all__) <= set(dir(threadful))
+
+    try:
+        threadful.does_not_exist
+    except AttributeError as e:
+        assert "does_not_exist" in str(e)
+    else:  # pragma: no cover
+        raise AssertionError("expected AttributeError")
@@ -0,0 +1,151 @@
+import threading
+import time
+
+import pytest
+
+from threadful import ShutdownError, WorkStealingPool
+
+
+def test_pool_basic():
+    with WorkStealingPool(workers=2) as pool:
+
+        @pool.thread
+        def double(value: int) -> int:
+            return value * 2
+
+        assert double(2).join() == 4
+        assert pool.submit(pow, 3, 2).join() == 9
+        assert double(1).then(lambda it: it + 1).join() == 3
+
+        task = double(5)
+        assert task.result(wait=True).unwrap() == 10
+        assert task.is_done()
+        assert task.start() is task  # duplicate starts are ignored
+
+        @pool.thread
+        def fails() -> None:
+            raise ValueError("nope")
+
+        with pytest.raises(ValueError):
+            fails().join()
+        assert fails().catch(lambda _: 0).join() == 0
+
+
+def test_pool_nested_fan_out_does_not_deadlock():
+    # a single worker would deadlock if join() blocked instead of helping
+    pool = WorkStealingPool(workers=1)
+
+    @pool.thread
+    def fib(n: int) -> int:
+        if n < 2:
+            return n
+        left, right = fib(n - 1).start(), fib(n - 2).start()
+        return left.join() + right.join()
+
+    assert fib(12).join(timeout=30) == 144
+    assert not pool.shutdown().dropped
+
+
+def test_pool_local_lifo():
+    pool = WorkStealingPool(workers=1)
+    order = []
+
+    @pool.thread
+    def child(value: int) -> None:
+        order.append(value)
+
+    @pool.thread
+    def parent() -> None:
+        # pushed to the local deque and only run once parent() joins: newest first
+        tasks = [child(value).start() for value in range(3)]
+        for task in reversed(tasks):
+            task.join()
+
+    parent().join()
+    assert order == [2, 1, 0]
+    pool.shutdown()
+
+
+def test_pool_steals():
+    pool = WorkStealingPool(workers=2)
+    started = threading.Barrier(2, timeout=5)
+
+    @pool.thread
+    def meet() -> str:
+        started.wait()  # only passes if both children run at the same time
+        return threading.current_thread().name
+
+    @pool.thread
+    def parent() -> set[str]:
+        first, second = meet().start(), meet().start()
+        return {first.join(), second.join()}
+
+    # the parent's worker runs one child while helping, the idle worker steals the other one
+    assert len(parent().join(timeout=10)) == 2
+    pool.shutdown()
+
+
+def test_pool_join_timeout():
+    pool = WorkStealingPool(workers=1)
+    release = threading.Event()
+
+    task = pool.submit(release.wait)
+    with pytest.raises(TimeoutError):
+        task.join(timeout=0.01)
+
+    release.set()
+    assert task.join()
+    pool.shutdown()
+
+
+def test_pool_shutdown():
+    pool = WorkStealingPool(workers=1)
+    running = threading.Event()
+    release = threading.Event()
+
+    def block() -> bool:
+        running.set()
+        return release.wait()
+
+    busy = pool.submit(block)
+    queued = pool.submit(time.sleep, 0)
+    running.wait()
+
+    report = pool.shutdown(wait=False)
+    assert report.cancelled == (queued,)
+    assert report.unfinished == (busy,)
+    assert isinstance(queued.result().unwrap_err(), ShutdownError)
+
+    late = pool.submit(time.sleep, 0)
+    assert isinstance(late.result().unwrap_err(), ShutdownError)
+
+    release.set()
+    report = pool.shutdown(timeout=5)
+    assert busy.join()
+    assert not report.unfinished
+
+
+def test_pool_shutdown_drains_nested():
+    pool = WorkStealingPool(workers=2)
+    release = threading.Event()
+
+    @pool.thread
+    def child() -> int:
+        return 1
+
+    @pool.thread
+    def parent() -> int:
+        release.wait()
+        return child().join() + 1
+
+    task = parent().start()
+    queued = [pool.submit(time.sleep, 0) for _ in range(3)]
+
+    timer = threading.Timer(0.05, release.set)
+    timer.start()
+    report = pool.shutdown(cancel_pending=False, timeout=5)
+
+    assert task.join() == 2
+    assert task in report.drained
+    assert all(_ in report.drained for _ in queued)
+    assert not report.dropped
@@ -0,0 +1,151 @@
+import time
+
+import pytest
+
+from threadful import ShutdownError, ShutdownReport, restart, shutdown, thread
+
+
+@pytest.fixture(autouse=True)
+def accept_work():
+    restart()
+    yield
+    restart()
+
+
+@thread
+def sleepy(duration: float) -> float:
+    time.sleep(duration)
+    return duration
+
+
+def test_shutdown_drains_running():
+    running = sleepy(0.5).start()
+
+    report = shutdown(timeout=2)
+
+    assert report.drained == (running,)
+    assert report.dropped == ()
+    assert running.join() == 0.5
+
+
+def test_shutdown_cancels_pending():
+    pending = sleepy(0.1)
+
+    report = shutdown()
+
+    assert report.cancelled == (pending,)
+    assert report.dropped == (pending,)
+    assert isinstance(pending.result().unwrap_err(), ShutdownError)
+
+    with pytest.raises(ShutdownError):
+        pending.join()
+
+    # a second shutdown doesn't report it again
+    assert shutdown() == ShutdownReport()
+
+
+def test_shutdown_starts_pending():
+    pending = sleepy(0.1).then(lambda it: it * 2)
+
+    report = shutdown(cancel_pending=False)
+
+    assert pending in report.drained
+    assert not report.dropped
+    assert pending.join() == 0.2
+
+
+def test_shutdown_timeout():
+    slow = sleepy(2).start()
+
+    report = shutdown(timeout=0.1)
+    assert report.unfinished == (slow,)
+    assert report.dropped == (slow,)
+
+    report = shutdown(wait=False)
+    assert report.unfinished == (slow,)
+
+    assert slow.join() == 2
+
+
+def test_no_new_work_after_shutdown():
+    shutdown()
+
+    late = sleepy(0.1)
+    assert late.is_done()
+    assert isinstance(late.result().unwrap_err(), ShutdownError)
+
+
+def test_shutdown_builder_copies():
+    base = sleepy(0.1)
+    chained = base.then(lambda it: it * 2)
+
+    report = shutdown(cancel_pending=False)
+    assert report.drained == (chained,)
+    assert chained.join() == 0.2
+
+    restart()
+    base = sleepy(0.1)
+    chained = base.catch(lambda _: 0)
+
+    report = shutdown()
+    assert report.cancelled == (chained,)
+    assert len(report.dropped) == 1
+
+
+def test_shutdown_drains_nested():
+    @thread
+    def parent() -> float:
+        time.sleep(0.2)  # shutdown() is called in the meantime
+        return sleepy(0.1).join() * 2
+
+    running = parent().start()
+    report = shutdown(timeout=5)
+
+    assert running in report.drained
+    assert len(report.drained) == 2  # the child too
+    assert not report.dropped
+    assert running.join() == 0.2
+
+
+def test_shutdown_aborted():
+    child = sleepy(0.1)  # created before shutdown, so cancelled
+
+    @thread
+    def parent() -> float:
+        time.sleep(0.2)
+        return child.join()
+
+    running = parent().start()
+    report = shutdown(timeout=5)
+
+    assert report.cancelled == (child,)
+    assert report.aborted == (running,)
+    assert set(report.dropped) == {child, running}
+    assert not report.drained
+
+    with pytest.raises(ShutdownError):
+        running.join()
+
+
+def test_cancelled_never_runs():
+    calls = []
+
+    @thread
+    def track() -> None:
+        calls.append(1)
+
+    handle = track()
+    handle._cancel()
+    handle.run()  # as if the thread was launched anyway
+
+    assert not calls
+    assert not hasattr(handle, "_target")
+    assert isinstance(handle.result().unwrap_err(), ShutdownError)
+
+
+def test_restart():
+    shutdown()
+    assert isinstance(sleepy(0).result(wait=True).unwrap_err(), ShutdownError)
+
+    restart()
+    assert sleepy(0).join() == 0
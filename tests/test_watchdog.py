@@ -0,0 +1,165 @@
+import threading
+import time
+
+import pytest
+
+from threadful import Watchdog, restart, thread
+from threadful.watchdog import print_stall
+
+
+@pytest.fixture(autouse=True)
+def accept_work():
+    restart()
+    yield
+    restart()
+
+
+def wait_until(condition, timeout: float = 5) -> None:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "condition was never met"
+        time.sleep(0.01)
+
+
+@thread
+def blocked(entered: threading.Event, lock: threading.Lock) -> bool:
+    entered.set()
+    with lock:
+        return True
+
+
+def test_watchdog_reports_stall(capsys):
+    lock = threading.Lock()
+    lock.acquire()
+    entered = threading.Event()
+    reported = threading.Event()
+    stalled = []
+
+    def hook(stall):
+        if stall.handle is promise:
+            stalled.append(stall)
+            reported.set()
+
+    promise = blocked(entered, lock).start()
+    entered.wait()
+    with Watchdog(threshold=0, interval=0.01, hook=hook) as dog:
+        assert reported.wait(5)
+        assert promise not in {stall.handle for stall in dog.check()}  # reported only once
+
+    lock.release()
+    assert promise.join()
+
+    assert len(stalled) == 1
+    stall = stalled[0]
+    assert stall.handle is promise
+    assert not stall.deadlock
+    assert any(frame.name == "blocked" for frame in stall.stack)
+
+    print_stall(stall)
+    assert promise.name in capsys.readouterr().err
+
+
+def test_watchdog_ignores_fast():
+    lock = threading.Lock()
+    entered = threading.Event()
+    dog = Watchdog(threshold=60)
+    promise = blocked(entered, lock).start()
+    assert promise not in {stall.handle for stall in dog.check()}
+    assert promise.join()
+
+
+def test_watchdog_broken_hook(capsys):
+    lock = threading.Lock()
+    lock.acquire()
+    entered = threading.Event()
+    calls = []
+
+    def hook(stall):
+        if stall.handle is not promise:
+            return
+        calls.append(stall)
+        if len(calls) == 1:
+            raise ValueError("broken hook")
+        dog.stop()  # stopping from within the hook is allowed
+
+    promise = blocked(entered, lock).start()
+    entered.wait()
+    dog = Watchdog(threshold=0, interval=0.01, hook=hook).start()
+    thread_ = dog._thread
+
+    thread_.join(5)
+    assert not thread_.is_alive()
+    assert dog._thread is None
+    assert len(calls) == 2  # the failed report was retried
+    assert "broken hook" in capsys.readouterr().err
+
+    lock.release()
+    assert promise.join()
+
+
+def test_watchdog_deadlock():
+    handles = {}
+    ready = threading.Barrier(2)
+
+    @thread
+    def first() -> None:
+        ready.wait()
+        handles["second"].join(timeout=2)  # breaks the deadlock after a while
+
+    @thread
+    def second() -> None:
+        ready.wait()
+        handles["first"].join()
+
+    handles["first"] = first()
+    handles["second"] = second()
+    handles["first"].start()
+    handles["second"].start()
+    wait_until(lambda: handles["first"]._waiting_on and handles["second"]._waiting_on)
+
+    dog = Watchdog(threshold=0)
+    stalls = [stall for stall in dog.check() if stall.handle in handles.values()]
+    assert {stall.handle for stall in stalls} == {handles["first"], handles["second"]}
+    assert all(stall.deadlock for stall in stalls)
+    assert "deadlocked" in stalls[0].format()
+    assert "waiting on" in stalls[0].format()
+    assert not [stall for stall in dog.check() if stall.handle in handles.values()]
+
+    with pytest.raises(TimeoutError):
+        handles["first"].join()
+    with pytest.raises(TimeoutError):
+        handles["second"].join()
+
+
+def test_watchdog_slow_then_deadlock():
+    handles = {}
+    go = threading.Event()
+
+    @thread
+    def first() -> None:
+        go.wait()
+        handles["second"].join(timeout=2)
+
+    @thread
+    def second() -> None:
+        go.wait()
+        handles["first"].join()
+
+    handles["first"] = first()
+    handles["second"] = second()
+    handles["first"].start()
+    handles["second"].start()
+
+    dog = Watchdog(threshold=0)
+    # slow, not deadlocked yet:
+    assert not any(stall.deadlock for stall in dog.check() if stall.handle in handles.values())
+
+    go.set()
+    wait_until(lambda: handles["first"]._waiting_on and handles["second"]._waiting_on)
+
+    stalls = [stall for stall in dog.check() if stall.handle in handles.values()]
+    assert len(stalls) == 2
+    assert all(stall.deadlock for stall in stalls)
+
+    with pytest.raises(TimeoutError):
+        handles["second"].join()